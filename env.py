@@ -11,4 +11,9 @@ ROOT_PAGE_ID = os.getenv("ROOT_PAGE_ID")
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 RETRY_DELAYS = [int(x) for x in os.getenv("RETRY_DELAYS", "1,3,5").split(",")]
 CONCURRENCY_LIMIT = int(os.getenv("CONCURRENCY_LIMIT", "5"))
-TIMEOUT_MS = int(os.getenv("TIMEOUT_MS", "30000"))
\ No newline at end of file
+TIMEOUT_MS = int(os.getenv("TIMEOUT_MS", "30000"))
+
+# HTTP server admission control
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "2"))
+MAX_QUEUED_REQUESTS = int(os.getenv("MAX_QUEUED_REQUESTS", "16"))
+QUEUE_TIMEOUT_MS = int(os.getenv("QUEUE_TIMEOUT_MS", "30000"))
@@ -1,8 +1,11 @@
 import json
 import logging
-from typing import Dict, Any, Optional, Union, Callable
+import math
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, Union, Callable, Awaitable
 import asyncio
 
+from env import MAX_CONCURRENT_REQUESTS, MAX_QUEUED_REQUESTS, QUEUE_TIMEOUT_MS
 from main import run_notion_task
 
 logger = logging.getLogger("NOTION_HANDLER")
@@ -14,11 +17,101 @@ handler.setFormatter(
 logger.addHandler(handler)
 
 
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted because the handler is at capacity."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class NotionRequestHandler:
     """A flexible handler for Notion API requests."""
 
-    async def handle_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle a Notion API request."""
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        max_queued: int = MAX_QUEUED_REQUESTS,
+        queue_timeout_ms: int = QUEUE_TIMEOUT_MS,
+    ):
+        """
+        Args:
+            max_concurrent: Maximum number of tasks running at the same time
+            max_queued: Maximum number of requests waiting for a free slot
+            queue_timeout_ms: How long a queued request waits before it is rejected
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout_ms = queue_timeout_ms
+        self.active = 0
+        self.queued = 0
+        # Created lazily so the semaphore binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def retry_after(self) -> int:
+        """Suggested number of seconds a rejected client should wait."""
+        return max(1, math.ceil(self.queue_timeout_ms / 1000))
+
+    @asynccontextmanager
+    async def admit(self):
+        """
+        Reserve a task slot, waiting in a bounded queue if all slots are busy.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait times out
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        if self._semaphore.locked():
+            if self.queued >= self.max_queued:
+                logger.warning(
+                    f"Rejecting request: {self.active} active, {self.queued} queued"
+                )
+                raise AdmissionRejected(
+                    "Server busy: request queue is full", self.retry_after
+                )
+
+            self.queued += 1
+            try:
+                await asyncio.wait_for(
+                    self._semaphore.acquire(), timeout=self.queue_timeout_ms / 1000
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Rejecting request: timed out waiting in queue")
+                raise AdmissionRejected(
+                    "Server busy: timed out waiting for a free slot", self.retry_after
+                ) from None
+            finally:
+                self.queued -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    async def handle_request(
+        self,
+        request_data: Dict[str, Any],
+        client=None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Handle a Notion API request.
+
+        Failed requests return a result with "status": "error" and the
+        reason under "error".
+
+        Args:
+            request_data: Task configuration, see run_notion_task
+            client: Optional shared Notion client to run the task with
+            progress_callback: Optional coroutine function receiving progress events
+        """
         logger.info(f"Processing Notion request")
 
         # Add request validation if needed
@@ -29,7 +122,12 @@ class NotionRequestHandler:
 
         # Process the request
         try:
-            result = await run_notion_task(request_data)
+            result = await run_notion_task(
+                request_data, client=client, progress_callback=progress_callback
+            )
+            # Report task failures under the same key as request errors
+            if "error_message" in result:
+                result["error"] = result.pop("error_message")
             return result
         except Exception as e:
             logger.exception("Error processing request")
@@ -41,6 +139,9 @@ class NotionRequestHandler:
         """
         Create an adapter function for different server frameworks.
 
+        Requests handled through the adapter go through admission control;
+        rejected requests get an error result with a "retry_after" hint.
+
         Args:
             input_extractor: Function to extract input data from request object
             output_formatter: Function to format output for response
@@ -54,12 +155,21 @@ class NotionRequestHandler:
                 except Exception as e:
                     logger.error(f"Error extracting input: {e}")
                     result = {"status": "error", "error": "Invalid request format"}
+                    return output_formatter(result) if output_formatter else result
             else:
                 # Default extraction - assume request_obj is already the input data
                 input_data = request_obj
 
             # Process the request
-            result = await self.handle_request(input_data)
+            try:
+                async with self.admit():
+                    result = await self.handle_request(input_data)
+            except AdmissionRejected as e:
+                result = {
+                    "status": "error",
+                    "error": str(e),
+                    "retry_after": e.retry_after,
+                }
 
             # Format the output
             if output_formatter:
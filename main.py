@@ -5,7 +5,8 @@ Main module for Notion MCP client.
 import asyncio
 import time
 import logging
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Awaitable, Callable, Optional
 
 from env import ROOT_PAGE_ID
 from client import get_notion_client
@@ -24,7 +25,21 @@ _console_handler.setFormatter(_formatter)
 logger.addHandler(_console_handler)
 
 
-async def run_notion_task(config: Dict[str, Any] = None):
+@asynccontextmanager
+async def _use_client(client=None):
+    """Yield the given Notion client, or a fresh one if none is provided."""
+    if client is not None:
+        yield client
+    else:
+        async with get_notion_client() as notion:
+            yield notion
+
+
+async def run_notion_task(
+    config: Dict[str, Any] = None,
+    client=None,
+    progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+):
     """
     Run Notion tasks based on configuration.
 
@@ -38,6 +53,10 @@ async def run_notion_task(config: Dict[str, Any] = None):
                 "params": {}  # Operation-specific parameters
             }
         }
+        client: Optional shared Notion client. If omitted, a client is
+            created for this task and closed when it finishes.
+        progress_callback: Optional coroutine function called with a
+            progress event dict as each database is started and completed.
     """
     start_time = time.time()
     results = {
@@ -50,13 +69,21 @@ async def run_notion_task(config: Dict[str, Any] = None):
         "elapsed_time": 0,
     }
 
+    async def _report(event: Dict[str, Any]):
+        # Progress reporting is best effort and must never fail the task
+        if progress_callback:
+            try:
+                await progress_callback(event)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
     try:
         config = config or {}
         page_id = config.get("root_page_id", ROOT_PAGE_ID)
         db_filter = config.get("database_filter", [])
         operation_config = config.get("operation", {})
 
-        async with get_notion_client() as notion:
+        async with _use_client(client) as notion:
             # Query all databases
             databases_dict = await query_page_for_databases(notion, page_id)
 
@@ -73,14 +100,29 @@ async def run_notion_task(config: Dict[str, Any] = None):
             total_failed = 0
             total_skipped = 0
 
+            await _report(
+                {"event": "databases_found", "databases": list(databases_dict)}
+            )
+
             for database_title, database_id in databases_dict.items():
                 logger.info(f"Processing database: {database_title}, ID: {database_id}")
+                await _report({"event": "database_started", "database": database_title})
 
                 # Get all pages in the database
                 pages_list = await query_database_for_all_pages(notion, database_id)
 
                 if not pages_list:
                     logger.warning(f"No pages found in database {database_title}")
+                    await _report(
+                        {
+                            "event": "database_completed",
+                            "database": database_title,
+                            "total": 0,
+                            "success": 0,
+                            "failed": 0,
+                            "skipped": 0,
+                        }
+                    )
                     continue
 
                 # Process pages concurrently
@@ -92,6 +134,13 @@ async def run_notion_task(config: Dict[str, Any] = None):
                 total_success += process_result["success"]
                 total_failed += process_result["failed"]
                 total_skipped += process_result["skipped"]
+                await _report(
+                    {
+                        "event": "database_completed",
+                        "database": database_title,
+                        **process_result,
+                    }
+                )
 
             results["pages_processed"] = total_pages
             results["success_count"] = total_success
@@ -0,0 +1,174 @@
+# server.py
+"""
+Async HTTP server for Notion MCP.
+
+Exposes NotionRequestHandler over HTTP with admission control:
+
+    POST /notion   Run a Notion task (see run_notion_task for the body format)
+    GET  /health   Report server load, for use by load balancers
+
+Requests beyond the concurrency limit wait in a bounded queue; when the queue
+is full, or a request waits too long, the server answers 429 with a
+Retry-After header. A task that fails (for example because of a bad page ID
+or token) is answered with 422. All tasks share a single Notion client and its
+connection pool.
+
+Send "Accept: application/x-ndjson" (or "?stream=1") to receive progress
+events as newline-delimited JSON while the task runs. The last line is a
+"result" event holding the same payload as the non-streaming response.
+"""
+import argparse
+import json
+import logging
+from typing import Dict, Any
+
+from aiohttp import web
+
+from client import get_notion_client
+from handler import NotionRequestHandler, AdmissionRejected
+
+logger = logging.getLogger("NOTION_SERVER")
+logger.setLevel(logging.INFO)
+handler = logging.StreamHandler()
+handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+logger.addHandler(handler)
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+REQUEST_HANDLER_KEY = web.AppKey("request_handler", NotionRequestHandler)
+NOTION_CLIENT_KEY = web.AppKey("notion", object)
+
+
+def _wants_stream(request: web.Request) -> bool:
+    """Check whether the client asked for a streaming progress response."""
+    if request.query.get("stream", "").lower() in ("1", "true", "yes"):
+        return True
+    return NDJSON_CONTENT_TYPE in request.headers.get("Accept", "")
+
+
+def _busy_response(e: AdmissionRejected) -> web.Response:
+    return web.json_response(
+        {"status": "error", "error": str(e)},
+        status=429,
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+async def _notion_client_ctx(app: web.Application):
+    """Open one Notion client for the lifetime of the app."""
+    async with get_notion_client() as notion:
+        app[NOTION_CLIENT_KEY] = notion
+        yield
+
+
+async def handle_notion(request: web.Request) -> web.StreamResponse:
+    """Handle POST /notion."""
+    request_handler: NotionRequestHandler = request.app[REQUEST_HANDLER_KEY]
+
+    try:
+        input_data = await request.json()
+    except (ValueError, LookupError):
+        # ValueError covers malformed JSON and undecodable bytes, LookupError
+        # an unknown charset in the Content-Type header
+        return web.json_response(
+            {"status": "error", "error": "Invalid request format: body is not JSON"},
+            status=400,
+        )
+    if not isinstance(input_data, dict):
+        return web.json_response(
+            {
+                "status": "error",
+                "error": "Invalid request format: expected a JSON object",
+            },
+            status=400,
+        )
+
+    try:
+        async with request_handler.admit():
+            if not _wants_stream(request):
+                result = await request_handler.handle_request(
+                    input_data, client=request.app[NOTION_CLIENT_KEY]
+                )
+                # Task errors come from the request or Notion, not the server
+                status = 200 if result.get("status") == "success" else 422
+                return web.json_response(result, status=status)
+
+            response = web.StreamResponse(headers={"Content-Type": NDJSON_CONTENT_TYPE})
+            await response.prepare(request)
+
+            disconnected = False
+
+            async def _send(event: Dict[str, Any]):
+                # A client that goes away must not fail the Notion task, so stop
+                # streaming and let the task run to completion.
+                nonlocal disconnected
+                if disconnected:
+                    return
+                try:
+                    await response.write((json.dumps(event) + "\n").encode("utf-8"))
+                except ConnectionError as e:
+                    disconnected = True
+                    logger.warning(f"Client disconnected, no longer streaming: {e}")
+
+            await _send({"event": "started"})
+            result = await request_handler.handle_request(
+                input_data,
+                client=request.app[NOTION_CLIENT_KEY],
+                progress_callback=_send,
+            )
+            await _send({"event": "result", **result})
+            if not disconnected:
+                try:
+                    await response.write_eof()
+                except ConnectionError:
+                    pass
+            return response
+    except AdmissionRejected as e:
+        return _busy_response(e)
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    """Handle GET /health."""
+    request_handler: NotionRequestHandler = request.app[REQUEST_HANDLER_KEY]
+    return web.json_response(
+        {
+            "status": "ok",
+            "active": request_handler.active,
+            "queued": request_handler.queued,
+            "max_concurrent": request_handler.max_concurrent,
+            "max_queued": request_handler.max_queued,
+        }
+    )
+
+
+def create_app(request_handler: NotionRequestHandler = None) -> web.Application:
+    """
+    Create the aiohttp application.
+
+    Args:
+        request_handler: Handler to serve requests with. A new one configured
+            from the environment is used if omitted.
+    """
+    app = web.Application()
+    app[REQUEST_HANDLER_KEY] = request_handler or NotionRequestHandler()
+    app.cleanup_ctx.append(_notion_client_ctx)
+    app.router.add_post("/notion", handle_notion)
+    app.router.add_get("/health", handle_health)
+    return app
+
+
+def main():
+    """Entry point for the HTTP server."""
+    parser = argparse.ArgumentParser(description="Notion MCP HTTP server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    args = parser.parse_args()
+
+    logger.info(f"Starting Notion HTTP server on {args.host}:{args.port}")
+    web.run_app(create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
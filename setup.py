@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="notion-mcp",
@@ -6,11 +6,22 @@ setup(
     description="Model Context Protocol (MCP) client for Notion API",
     author="Evan Yang",
     author_email="sparkbye@hotmail.com",
-    packages=find_packages(),
+    # Flat layout: the modules import each other by name
+    py_modules=[
+        "client",
+        "env",
+        "handler",
+        "main",
+        "mcp_server",
+        "operations",
+        "processor",
+        "server",
+        "utils",
+    ],
     install_requires=[
         "notion-client>=1.0.0",
         "python-dotenv>=0.19.0",
-        "aiohttp>=3.8.0",
+        "aiohttp>=3.9.0",
     ],
     extras_require={
         "mcp": ["mcp>=0.1.0"],  # Optional MCP dependency
@@ -23,9 +34,9 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "notion-mcp=notion_mcp.main:main",
-            "notion-mcp-server=notion_mcp.mcp_server:main",
+            "notion-mcp=main:main",
+            "notion-mcp-server=server:main",
         ],
     },
-    python_requires=">=3.7",
+    python_requires=">=3.8",
 )
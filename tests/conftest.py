@@ -0,0 +1,64 @@
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+# The modules live at the repository root and import each other by name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+import server  # noqa: E402
+
+
+class FakeNotion:
+    """Stand-in for the Notion client; operations are stubbed separately."""
+
+
+@pytest.fixture
+def notion_clients(monkeypatch):
+    """Replace get_notion_client and record every client it opens."""
+    opened = []
+
+    @asynccontextmanager
+    async def fake_get_notion_client():
+        client = FakeNotion()
+        opened.append(client)
+        yield client
+
+    monkeypatch.setattr(main, "get_notion_client", fake_get_notion_client)
+    monkeypatch.setattr(server, "get_notion_client", fake_get_notion_client)
+    return opened
+
+
+@pytest.fixture
+def notion_operations(monkeypatch):
+    """
+    Stub the Notion operations used by run_notion_task.
+
+    The root page holds two databases with two pages each, and every page is
+    processed successfully. Tests can set "error" to make the database query fail.
+    """
+    state = {"clients": [], "error": None}
+
+    async def fake_query_page_for_databases(client, page_id):
+        state["clients"].append(client)
+        if state["error"]:
+            raise state["error"]
+        return {"Articles": "db-1", "Resources": "db-2"}
+
+    async def fake_query_database_for_all_pages(client, database_id):
+        return [f"{database_id}-page-1", f"{database_id}-page-2"]
+
+    async def fake_process_pages_with_semaphore(client, pages_list, operation_config):
+        total = len(pages_list)
+        return {"total": total, "success": total, "failed": 0, "skipped": 0}
+
+    monkeypatch.setattr(main, "query_page_for_databases", fake_query_page_for_databases)
+    monkeypatch.setattr(
+        main, "query_database_for_all_pages", fake_query_database_for_all_pages
+    )
+    monkeypatch.setattr(
+        main, "process_pages_with_semaphore", fake_process_pages_with_semaphore
+    )
+    return state
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from handler import AdmissionRejected, NotionRequestHandler
+
+
+def assert_idle(request_handler):
+    """Check that all counters and the semaphore are back to their start values."""
+    assert request_handler.active == 0
+    assert request_handler.queued == 0
+    assert request_handler._semaphore._value == request_handler.max_concurrent
+
+
+async def _hold(request_handler, seconds):
+    async with request_handler.admit():
+        await asyncio.sleep(seconds)
+
+
+def test_admit_queues_requests_until_a_slot_is_free():
+    request_handler = NotionRequestHandler(
+        max_concurrent=1, max_queued=1, queue_timeout_ms=1000
+    )
+
+    peak_active = 0
+
+    async def _hold_and_record():
+        nonlocal peak_active
+        async with request_handler.admit():
+            peak_active = max(peak_active, request_handler.active)
+            await asyncio.sleep(0.05)
+
+    async def run():
+        first = asyncio.ensure_future(_hold_and_record())
+        second = asyncio.ensure_future(_hold_and_record())
+        await asyncio.sleep(0.01)
+        assert request_handler.active == 1
+        assert request_handler.queued == 1
+        await asyncio.gather(first, second)
+
+    asyncio.run(run())
+    assert peak_active == request_handler.max_concurrent
+    assert_idle(request_handler)
+
+
+def test_admit_rejects_when_queue_is_full():
+    request_handler = NotionRequestHandler(
+        max_concurrent=1, max_queued=1, queue_timeout_ms=1000
+    )
+
+    async def run():
+        holder = asyncio.ensure_future(_hold(request_handler, 0.1))
+        waiter = asyncio.ensure_future(_hold(request_handler, 0))
+        await asyncio.sleep(0.01)
+        assert request_handler.active == 1
+        assert request_handler.queued == 1
+
+        with pytest.raises(AdmissionRejected, match="queue is full") as exc_info:
+            async with request_handler.admit():
+                pass
+        assert exc_info.value.retry_after == 1
+
+        await asyncio.gather(holder, waiter)
+
+    asyncio.run(run())
+    assert_idle(request_handler)
+
+
+def test_admit_rejects_when_queue_wait_times_out():
+    request_handler = NotionRequestHandler(
+        max_concurrent=1, max_queued=1, queue_timeout_ms=20
+    )
+
+    async def run():
+        holder = asyncio.ensure_future(_hold(request_handler, 0.1))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejected, match="timed out") as exc_info:
+            async with request_handler.admit():
+                pass
+        assert exc_info.value.__suppress_context__
+
+        await holder
+
+    asyncio.run(run())
+    assert_idle(request_handler)
+
+
+def test_admit_releases_queue_slot_when_waiter_is_cancelled():
+    request_handler = NotionRequestHandler(
+        max_concurrent=1, max_queued=1, queue_timeout_ms=1000
+    )
+
+    async def run():
+        holder = asyncio.ensure_future(_hold(request_handler, 0.05))
+        waiter = asyncio.ensure_future(_hold(request_handler, 0))
+        await asyncio.sleep(0.01)
+        assert request_handler.queued == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert request_handler.queued == 0
+
+        await holder
+
+    asyncio.run(run())
+    assert_idle(request_handler)
+
+
+def test_adapter_returns_retry_after_when_rejected():
+    request_handler = NotionRequestHandler(
+        max_concurrent=1, max_queued=0, queue_timeout_ms=3000
+    )
+    adapter = request_handler.create_adapter()
+
+    async def run():
+        async with request_handler.admit():
+            return await adapter({"root_page_id": "root"})
+
+    result = asyncio.run(run())
+    assert result == {
+        "status": "error",
+        "error": "Server busy: request queue is full",
+        "retry_after": 3,
+    }
+    assert_idle(request_handler)
+
+
+def test_handle_request_reports_task_errors_under_error(
+    notion_clients, notion_operations
+):
+    notion_operations["error"] = RuntimeError("object not found")
+
+    result = asyncio.run(NotionRequestHandler().handle_request({"root_page_id": "x"}))
+
+    assert result["status"] == "error"
+    assert result["error"] == "object not found"
+    assert "error_message" not in result
@@ -0,0 +1,75 @@
+import asyncio
+
+from conftest import FakeNotion
+from main import run_notion_task
+
+
+def test_run_notion_task_opens_a_client_when_none_is_shared(
+    notion_clients, notion_operations
+):
+    result = asyncio.run(run_notion_task({"root_page_id": "root"}))
+
+    assert result["status"] == "success"
+    assert result["databases_processed"] == 2
+    assert result["pages_processed"] == 4
+    assert len(notion_clients) == 1
+    assert notion_operations["clients"] == notion_clients
+
+
+def test_run_notion_task_uses_the_shared_client(notion_clients, notion_operations):
+    shared = FakeNotion()
+
+    result = asyncio.run(run_notion_task({"root_page_id": "root"}, client=shared))
+
+    assert result["status"] == "success"
+    assert notion_clients == []
+    assert notion_operations["clients"] == [shared]
+
+
+def test_run_notion_task_reports_progress(notion_clients, notion_operations):
+    events = []
+
+    async def record(event):
+        events.append(event)
+
+    asyncio.run(run_notion_task({"root_page_id": "root"}, progress_callback=record))
+
+    assert [event["event"] for event in events] == [
+        "databases_found",
+        "database_started",
+        "database_completed",
+        "database_started",
+        "database_completed",
+    ]
+    assert events[0]["databases"] == ["Articles", "Resources"]
+    assert events[2] == {
+        "event": "database_completed",
+        "database": "Articles",
+        "total": 2,
+        "success": 2,
+        "failed": 0,
+        "skipped": 0,
+    }
+
+
+def test_run_notion_task_ignores_progress_callback_errors(
+    notion_clients, notion_operations
+):
+    async def broken(event):
+        raise RuntimeError("callback failed")
+
+    result = asyncio.run(
+        run_notion_task({"root_page_id": "root"}, progress_callback=broken)
+    )
+
+    assert result["status"] == "success"
+    assert result["pages_processed"] == 4
+
+
+def test_run_notion_task_reports_operation_errors(notion_clients, notion_operations):
+    notion_operations["error"] = RuntimeError("object not found")
+
+    result = asyncio.run(run_notion_task({"root_page_id": "root"}))
+
+    assert result["status"] == "error"
+    assert result["error_message"] == "object not found"
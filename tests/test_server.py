@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from handler import NotionRequestHandler
+from server import create_app
+
+
+def run_with_client(test, request_handler=None):
+    """Run a coroutine function against a test client for a fresh app."""
+
+    async def run():
+        app = create_app(request_handler)
+        async with TestClient(TestServer(app)) as client:
+            await test(client)
+
+    asyncio.run(run())
+
+
+def test_notion_returns_task_result(notion_clients, notion_operations):
+    async def test(client):
+        response = await client.post("/notion", json={"root_page_id": "root"})
+        assert response.status == 200
+        result = await response.json()
+        assert result["status"] == "success"
+        assert result["pages_processed"] == 4
+
+    run_with_client(test)
+    # One client is opened for the app and shared by every request
+    assert len(notion_clients) == 1
+    assert notion_operations["clients"] == notion_clients
+
+
+def test_notion_rejects_non_json_body(notion_clients, notion_operations):
+    async def test(client):
+        response = await client.post(
+            "/notion", data="not json", headers={"Content-Type": "application/json"}
+        )
+        assert response.status == 400
+        assert (await response.json())["status"] == "error"
+
+        response = await client.post(
+            "/notion",
+            data=b"{}",
+            headers={"Content-Type": "application/json; charset=bogus"},
+        )
+        assert response.status == 400
+
+    run_with_client(test)
+    assert notion_operations["clients"] == []
+
+
+def test_notion_rejects_non_object_body(notion_clients, notion_operations):
+    async def test(client):
+        response = await client.post("/notion", json=["root"])
+        assert response.status == 400
+        result = await response.json()
+        assert result["error"] == "Invalid request format: expected a JSON object"
+
+    run_with_client(test)
+    assert notion_operations["clients"] == []
+
+
+def test_notion_returns_422_for_failed_task(notion_clients, notion_operations):
+    notion_operations["error"] = RuntimeError("object not found")
+
+    async def test(client):
+        response = await client.post("/notion", json={"root_page_id": "missing"})
+        assert response.status == 422
+        result = await response.json()
+        assert result["status"] == "error"
+        assert result["error"] == "object not found"
+
+    run_with_client(test)
+
+
+def test_notion_returns_429_when_queue_is_full(notion_clients, notion_operations):
+    request_handler = NotionRequestHandler(
+        max_concurrent=1, max_queued=0, queue_timeout_ms=2000
+    )
+
+    async def test(client):
+        async with request_handler.admit():
+            response = await client.post("/notion", json={"root_page_id": "root"})
+        assert response.status == 429
+        assert response.headers["Retry-After"] == "2"
+        assert (await response.json())["status"] == "error"
+
+    run_with_client(test, request_handler)
+    assert notion_operations["clients"] == []
+
+
+def test_notion_streams_progress_events(notion_clients, notion_operations):
+    async def test(client):
+        response = await client.post(
+            "/notion",
+            json={"root_page_id": "root"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status == 200
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        body = await response.text()
+        events = [json.loads(line) for line in body.splitlines()]
+
+        assert [event["event"] for event in events] == [
+            "started",
+            "databases_found",
+            "database_started",
+            "database_completed",
+            "database_started",
+            "database_completed",
+            "result",
+        ]
+        assert events[-1]["status"] == "success"
+        assert events[-1]["pages_processed"] == 4
+
+    run_with_client(test)
+
+
+def test_health_reports_load(notion_clients, notion_operations):
+    request_handler = NotionRequestHandler(max_concurrent=3, max_queued=7)
+
+    async def test(client):
+        response = await client.get("/health")
+        assert response.status == 200
+        assert await response.json() == {
+            "status": "ok",
+            "active": 0,
+            "queued": 0,
+            "max_concurrent": 3,
+            "max_queued": 7,
+        }
+
+    run_with_client(test, request_handler)